@@ -20,6 +20,7 @@ from discord.ext import commands, tasks
 from .config import Config, ConfigError, load_config
 from .giveaway_manager import GiveawayManager
 from .storage import StateStorage
+from .views import participant_roster
 
 
 CHANNEL_MENTION_RE = re.compile(r"^<#?(\d+)>?$")
@@ -224,6 +225,14 @@ class GiveawayBot(commands.Bot):
         await self.manager.handle_scheduled()
         await self.manager.audit_overdue()
 
+    async def close(self) -> None:
+        """Flush pending state writes before disconnecting from Discord."""
+        self._scheduled_checker.cancel()
+        try:
+            await self.manager.close()
+        finally:
+            await super().close()
+
     async def on_ready(self) -> None:
         """Emit an informational log once Discord confirms the bot is ready."""
         logging.getLogger(__name__).info(
@@ -853,10 +862,8 @@ def register_commands(bot: GiveawayBot) -> None:
         if not giveaway.participants:
             await interaction.followup.send("No participants yet.", ephemeral=True)
             return
-        mentions = "\n".join(f"- <@{pid}>" for pid in giveaway.participants)
         await interaction.followup.send(
-            f"Participants for **{giveaway.title}** (`{giveaway.id}`):\n{mentions}",
-            ephemeral=True,
+            **participant_roster(giveaway), ephemeral=True
         )
 
     @bot.tree.command(
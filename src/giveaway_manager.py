@@ -26,6 +26,12 @@ from .views import GiveawayView
 
 log = logging.getLogger(__name__)
 
+# SystemRandom draws from os.urandom on every call, so one shared instance is safe.
+_SYSRNG = secrets.SystemRandom()
+
+# How long a channel resolved over HTTP is reused before fetching it again.
+_CHANNEL_CACHE_TTL = 60.0
+
 
 class GiveawayManager:
     """Coordinates giveaway lifecycle, persistence, and Discord interactions."""
@@ -42,6 +48,8 @@ class GiveawayManager:
         self._pending_tasks: Dict[str, asyncio.Task] = {}
         self._recurring_tasks: Dict[str, asyncio.Task] = {}
         self._state_lock = asyncio.Lock()
+        self._channel_cache: Dict[int, tuple[float, discord.TextChannel]] = {}
+        self._channel_fetch_inflight: Dict[int, asyncio.Future] = {}
 
     async def load(self) -> None:
         """Load persisted state and reschedule any existing giveaways."""
@@ -100,7 +108,7 @@ class GiveawayManager:
             pending_items = [
                 pending
                 for _, guild_state in self.state.iter_guild_states()
-                for pending in guild_state.pending_giveaways
+                for pending in guild_state.pending_giveaways.values()
             ]
         for pending in pending_items:
             await self._schedule_start(pending, reschedule=False)
@@ -111,7 +119,7 @@ class GiveawayManager:
             active_items = [
                 giveaway
                 for _, guild_state in self.state.iter_guild_states()
-                for giveaway in guild_state.giveaways
+                for giveaway in guild_state.giveaways.values()
                 if giveaway.is_active
             ]
         for giveaway in active_items:
@@ -124,16 +132,20 @@ class GiveawayManager:
             recurring_items = [
                 recurring
                 for _, guild_state in self.state.iter_guild_states()
-                for recurring in guild_state.recurring_giveaways
+                for recurring in guild_state.recurring_giveaways.values()
                 if recurring.enabled
             ]
         for recurring in recurring_items:
             await self._schedule_recurring(recurring, reschedule=False)
 
     async def save_state(self) -> None:
-        """Persist the current bot state to disk."""
+        """Queue the current bot state for persistence by the storage writer."""
         await self.storage.save(self.state)
 
+    async def close(self) -> None:
+        """Flush queued state writes; called when the bot shuts down."""
+        await self.storage.close()
+
     def _ensure_guild_state(self, guild_id: int) -> GuildState:
         """Fetch an existing guild state or create one with defaults."""
         state = self.state.ensure_guild_state(
@@ -238,6 +250,29 @@ class GiveawayManager:
         if needs_save:
             await self.save_state()
 
+    def _extend_blocklist(
+        self,
+        blocklist: tuple[set[int], list[RecentWinner]],
+        guild_id: int,
+        winners: Iterable[int],
+        giveaway_id: str,
+    ) -> None:
+        """Add freshly recorded winners to a precomputed blocklist so later picks honour them."""
+        guild_state = self.state.get_guild_state(guild_id)
+        if not (
+            guild_state
+            and guild_state.recent_winner_cooldown_enabled
+            and guild_state.recent_winner_cooldown_days > 0
+        ):
+            return
+        blocked, blocked_entries = blocklist
+        now = datetime.now(tz=UTC)
+        for winner_id in winners:
+            blocked.add(winner_id)
+            blocked_entries.append(
+                RecentWinner(user_id=winner_id, giveaway_id=giveaway_id, won_at=now)
+            )
+
     def is_admin(
         self,
         member: discord.Member,
@@ -494,7 +529,12 @@ class GiveawayManager:
         return giveaway
 
     async def end_giveaway(
-        self, guild_id: int, giveaway_id: str, *, notify: bool = True
+        self,
+        guild_id: int,
+        giveaway_id: str,
+        *,
+        notify: bool = True,
+        blocklist: Optional[tuple[set[int], list[RecentWinner]]] = None,
     ) -> Optional[Giveaway]:
         """Mark a giveaway as finished and handle winner selection."""
         async with self._state_lock:
@@ -504,16 +544,24 @@ class GiveawayManager:
             if not giveaway.is_active:
                 return giveaway
             giveaway.is_active = False
+            # The giveaway is already stored; only the cached active list changes.
+            self.state.get_guild_state(guild_id).invalidate_giveaways()
             await self.save_state()
 
         task = self._finish_tasks.pop(giveaway_id, None)
         current = asyncio.current_task()
         if task and task is not current:
             task.cancel()
-        await self._finalize_giveaway(giveaway, notify=notify)
+        await self._finalize_giveaway(giveaway, notify=notify, blocklist=blocklist)
         return giveaway
 
-    async def _finalize_giveaway(self, giveaway: Giveaway, *, notify: bool) -> None:
+    async def _finalize_giveaway(
+        self,
+        giveaway: Giveaway,
+        *,
+        notify: bool,
+        blocklist: Optional[tuple[set[int], list[RecentWinner]]] = None,
+    ) -> None:
         """Run winner selection, update the embed, and broadcast results."""
         channel = await self._fetch_text_channel(giveaway.channel_id)
         if not channel:
@@ -524,7 +572,7 @@ class GiveawayManager:
             )
             return
 
-        winners = await self._choose_winners(giveaway)
+        winners = await self._choose_winners(giveaway, blocklist=blocklist)
         giveaway.last_announced_winners = winners
 
         embed = self._embed_from_giveaway(giveaway, status="Finished", winners=winners)
@@ -542,9 +590,11 @@ class GiveawayManager:
                 await channel.send(
                     f"Giveaway **{giveaway.title}** ended without enough participants."
                 )
-            giveaway.participants.clear()
+            giveaway.clear_participants()
 
         await self._record_recent_winners(giveaway.guild_id, winners, giveaway.id)
+        if blocklist is not None and winners:
+            self._extend_blocklist(blocklist, giveaway.guild_id, winners, giveaway.id)
         await self.save_state()
         if winners:
             winner_mentions = ", ".join(f"<@{winner_id}>" for winner_id in winners)
@@ -568,9 +618,8 @@ class GiveawayManager:
                 return "This giveaway is no longer available."
             if not giveaway.is_active:
                 return "This giveaway has already finished."
-            if user.id in giveaway.participants:
+            if not giveaway.add_participant(user.id):
                 return "You have already joined this giveaway."
-            giveaway.participants.append(user.id)
             await self.save_state()
 
         await self._update_embed(giveaway)
@@ -589,9 +638,8 @@ class GiveawayManager:
                 return "This giveaway is no longer available."
             if not giveaway.is_active:
                 return "This giveaway has already finished."
-            if user.id not in giveaway.participants:
+            if not giveaway.remove_participant(user.id):
                 return "You are not part of this giveaway."
-            giveaway.participants.remove(user.id)
             await self.save_state()
 
         await self._update_embed(giveaway)
@@ -603,7 +651,7 @@ class GiveawayManager:
     async def list_giveaways(self, guild_id: int) -> Iterable[Giveaway]:
         """Return every giveaway (active and finished) for the guild."""
         async with self._state_lock:
-            return list(self.state.list_all(guild_id))
+            return self.state.list_all(guild_id)
 
     async def list_recurring_giveaways(self, guild_id: int) -> Iterable[RecurringGiveaway]:
         """Return every recurring giveaway schedule for the guild."""
@@ -611,7 +659,7 @@ class GiveawayManager:
             state = self.state.get_guild_state(guild_id)
             if not state:
                 return []
-            return list(state.recurring_giveaways)
+            return list(state.recurring_giveaways.values())
 
     async def get_pending_giveaway(
         self, guild_id: int, pending_id: str
@@ -630,20 +678,19 @@ class GiveawayManager:
                 if cooldown_days > 0
                 else None
             )
-            remaining: list[Giveaway] = []
             removed: list[Giveaway] = []
-            for giveaway in guild_state.giveaways:
+            for giveaway in guild_state.giveaways.values():
                 if giveaway.is_active:
-                    remaining.append(giveaway)
                     continue
                 if cutoff is not None and giveaway.end_time >= cutoff:
                     # Keep recently finished giveaways so recent winner cooldown can reference them.
-                    remaining.append(giveaway)
                     continue
                 removed.append(giveaway)
             if not removed:
                 return 0
-            guild_state.giveaways = remaining
+            for giveaway in removed:
+                del guild_state.giveaways[giveaway.id]
+            guild_state.invalidate_giveaways()
             await self.save_state()
 
         for giveaway in removed:
@@ -903,14 +950,20 @@ class GiveawayManager:
         await message.edit(embed=self._embed_from_giveaway(giveaway))
 
     async def _choose_winners(
-        self, giveaway: Giveaway, reroll: bool = False
+        self,
+        giveaway: Giveaway,
+        reroll: bool = False,
+        *,
+        blocklist: Optional[tuple[set[int], list[RecentWinner]]] = None,
     ) -> list[int]:
         """
         Select winners while respecting the configured cooldown.
 
         Participants not on cooldown are sampled first; if the giveaway still
         requires more winners the oldest recent winners who rejoined are added
-        so the giveaway can conclude cleanly.
+        so the giveaway can conclude cleanly. A precomputed ``blocklist`` (as
+        returned by ``_get_recent_winner_blocklist``) may be supplied to skip
+        recomputing it, e.g. during an audit sweep.
         """
         if len(giveaway.participants) == 0:
             return []
@@ -918,20 +971,23 @@ class GiveawayManager:
         population = list(giveaway.participants)
         if reroll and giveaway.last_announced_winners:
             # Allow reroll to avoid previous winners when possible
+            previous_winners = set(giveaway.last_announced_winners)
             population = [
-                p for p in population if p not in giveaway.last_announced_winners
+                p for p in population if p not in previous_winners
             ] or population
-        blocklist, blocked_entries = await self._get_recent_winner_blocklist(
-            giveaway.guild_id
+        blocked, blocked_entries = (
+            blocklist
+            if blocklist is not None
+            else await self._get_recent_winner_blocklist(giveaway.guild_id)
         )
 
         eligible_population = (
-            [p for p in population if p not in blocklist]
-            if blocklist
+            [p for p in population if p not in blocked]
+            if blocked
             else list(population)
         )
 
-        if blocklist and not eligible_population:
+        if blocked and not eligible_population:
             log.info(
                 "All participants eligible for giveaway %s are within the recent winner cooldown.",
                 giveaway.id,
@@ -941,12 +997,11 @@ class GiveawayManager:
                 guild_id=giveaway.guild_id,
             )
 
-        rng = secrets.SystemRandom()
         winners: list[int] = []
 
         if eligible_population and winners_count > 0:
             eligible_pick = min(winners_count, len(eligible_population))
-            winners.extend(rng.sample(eligible_population, eligible_pick))
+            winners.extend(_SYSRNG.sample(eligible_population, eligible_pick))
 
         remaining_slots = winners_count - len(winners)
         if remaining_slots > 0 and blocked_entries:
@@ -1142,7 +1197,7 @@ class GiveawayManager:
 
         async with self._state_lock:
             for guild_id, guild_state in self.state.iter_guild_states():
-                for giveaway in guild_state.giveaways:
+                for giveaway in guild_state.giveaways.values():
                     if giveaway.end_time <= now:
                         if giveaway.is_active:
                             to_end.append((guild_id, giveaway.id))
@@ -1152,15 +1207,27 @@ class GiveawayManager:
                         ):
                             to_finalize.append((guild_id, giveaway.id))
 
+        # Compute each guild's cooldown blocklist once for the whole sweep.
+        blocklists_by_guild: dict[int, tuple[set[int], list[RecentWinner]]] = {}
+        for guild_id, _ in (*to_end, *to_finalize):
+            if guild_id not in blocklists_by_guild:
+                blocklists_by_guild[guild_id] = await self._get_recent_winner_blocklist(
+                    guild_id
+                )
+
         for guild_id, giveaway_id in to_end:
-            await self.end_giveaway(guild_id, giveaway_id)
+            await self.end_giveaway(
+                guild_id, giveaway_id, blocklist=blocklists_by_guild[guild_id]
+            )
 
         for guild_id, giveaway_id in to_finalize:
             async with self._state_lock:
                 giveaway = self.state.get_giveaway(guild_id, giveaway_id)
                 if not giveaway or giveaway.last_announced_winners:
                     continue
-            await self._finalize_giveaway(giveaway, notify=True)
+            await self._finalize_giveaway(
+                giveaway, notify=True, blocklist=blocklists_by_guild[guild_id]
+            )
 
     async def set_timezone(self, guild_id: int, timezone_name: str) -> None:
         """Update the timezone for a guild and reschedule recurring giveaways."""
@@ -1174,7 +1241,7 @@ class GiveawayManager:
             if guild_state.timezone == timezone_name:
                 return
             guild_state.timezone = timezone_name
-            recurring_items = list(guild_state.recurring_giveaways)
+            recurring_items = list(guild_state.recurring_giveaways.values())
             for recurring in recurring_items:
                 next_start, next_end = self._compute_next_window(
                     guild_id, recurring.start_time, recurring.end_time
@@ -1378,14 +1445,48 @@ class GiveawayManager:
         self, channel_id: int
     ) -> Optional[discord.TextChannel]:
         """Fetch a text channel from cache or HTTP, returning None if unavailable."""
+        # discord.py's own cache is an O(1) lookup that tracks deletes and
+        # updates, so its channels are returned directly and never copied here.
         channel = self.bot.get_channel(channel_id)
         if isinstance(channel, discord.TextChannel):
             return channel
+        cached = self._channel_cache.get(channel_id)
+        if cached is not None:
+            if cached[0] > asyncio.get_running_loop().time():
+                return cached[1]
+            del self._channel_cache[channel_id]
+
+        # Coalesce concurrent cache misses into a single HTTP request.
+        inflight = self._channel_fetch_inflight.get(channel_id)
+        if inflight is None:
+            inflight = asyncio.create_task(self._fetch_text_channel_http(channel_id))
+            self._channel_fetch_inflight[channel_id] = inflight
+            inflight.add_done_callback(
+                lambda _: self._channel_fetch_inflight.pop(channel_id, None)
+            )
+        return await asyncio.shield(inflight)
+
+    async def _fetch_text_channel_http(
+        self, channel_id: int
+    ) -> Optional[discord.TextChannel]:
+        """Resolve a channel over HTTP and remember it for subsequent lookups."""
         try:
             fetched = await self.bot.fetch_channel(channel_id)
         except (discord.NotFound, discord.Forbidden, discord.HTTPException):
             return None
-        return fetched if isinstance(fetched, discord.TextChannel) else None
+        if not isinstance(fetched, discord.TextChannel):
+            return None
+        now = asyncio.get_running_loop().time()
+        # HTTP fetches are rare, so sweeping expired entries here keeps the cache
+        # bounded to channels resolved within the last TTL window.
+        for cached_id in [
+            cached_id
+            for cached_id, (expires, _) in self._channel_cache.items()
+            if expires <= now
+        ]:
+            del self._channel_cache[cached_id]
+        self._channel_cache[channel_id] = (now + _CHANNEL_CACHE_TTL, fetched)
+        return fetched
 
     async def _fetch_message(
         self, channel: discord.TextChannel, message_id: int
@@ -1423,10 +1524,11 @@ class GiveawayManager:
         )
         embed.add_field(name="Winners", value=str(winners), inline=True)
         embed.add_field(name="Participants", value=str(participants), inline=True)
-        end_local = end_time.astimezone(tz)
-        embed.add_field(
-            name="Ends At", value=end_local.strftime("%Y-%m-%d %H:%M %Z"), inline=False
-        )
+        if giveaway is not None and end_time is giveaway.end_time:
+            end_local_str = giveaway.end_time_local(tz)
+        else:
+            end_local_str = end_time.astimezone(tz).strftime("%Y-%m-%d %H:%M %Z")
+        embed.add_field(name="Ends At", value=end_local_str, inline=False)
         embed.add_field(name="Status", value=status, inline=True)
         if giveaway:
             embed.set_footer(text=f"Giveaway ID: {giveaway.id}")
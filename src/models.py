@@ -3,12 +3,88 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, time
-from typing import Dict, Iterable, List, Optional, Sequence
+from datetime import UTC, datetime, time, tzinfo
+from functools import lru_cache
+from sys import intern
+from typing import Dict, Iterable, ItemsView, List, Optional, Sequence
+
+
+# Single parsing entry point for stored ISO-8601 timestamps. On Python 3.11+
+# datetime.fromisoformat is C-implemented and already accepts "Z" suffixes.
+# datetimes are immutable, so repeated strings can share one parsed object.
+_parse_iso = lru_cache(maxsize=512)(datetime.fromisoformat)
+
+
+# Sentinel for payload.get() so absent keys don't allocate throwaway defaults.
+_MISSING = object()
+
+
+@lru_cache(maxsize=512)
+def _parse_hhmm(value: str) -> time:
+    """Parse an ``HH:MM`` string without going through ``strptime``."""
+    hours, _, minutes = value.partition(":")
+    return time(int(hours), int(minutes))
+
+
+def _intern_opt(value: object) -> Optional[str]:
+    """Intern an optional id string so dict lookups and comparisons hit the fast path."""
+    return intern(str(value)) if value is not None else None
+
+
+def _coerce_role_id(value: object) -> Optional[int]:
+    """Convert a configured role id to int, returning None when it is invalid."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _index_by_id(items: Iterable) -> dict:
+    """Key giveaway-like objects by their ``id`` attribute, keeping iteration order."""
+    return {item.id: item for item in items}
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC so every stored timestamp is timezone-aware."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _cached_isoformat(obj, name: str) -> str:
+    """Return ``getattr(obj, name).isoformat()``, reusing the string while the value is unchanged."""
+    value = getattr(obj, name)
+    cached = obj._iso_cache.get(name)
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    text = value.isoformat()
+    obj._iso_cache[name] = (value, text)
+    return text
+
+
+def _seed_isoformat(obj, name: str, parsed: datetime, text: str) -> None:
+    """Record ``text`` as the iso() string of ``name`` if the field still holds ``parsed``.
+
+    Loaders call this with the stored string a datetime was parsed from, so the
+    next save reuses it instead of formatting again. Values replaced during
+    __post_init__ (naive timestamps) keep being formatted normally.
+    """
+    if getattr(obj, name) is parsed:
+        obj._iso_cache[name] = (parsed, text)
+
+
+class _IsoFormatted:
+    """Base for models with an ``_iso_cache`` field, providing the iso() accessor."""
+
+    __slots__ = ()
+
+    def iso(self, name: str) -> str:
+        """Return the ISO-8601 string for a datetime field, cached until it is reassigned."""
+        return _cached_isoformat(self, name)
 
 
 @dataclass(slots=True)
-class Giveaway:
+class Giveaway(_IsoFormatted):
     """Represents an active or finished giveaway along with participants and metadata."""
     id: str
     guild_id: int
@@ -23,21 +99,85 @@ class Giveaway:
     scheduled_id: Optional[str] = None
     is_active: bool = True
     last_announced_winners: List[int] = field(default_factory=list)
+    # Transient (end_time, tz, text) of the localised end time shown in embeds;
+    # see end_time_local(). Never serialized.
+    _end_local: Optional[tuple[datetime, tzinfo, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Maps each participant to its position in ``participants`` for O(1)
+    # membership checks and swap-with-last removal.
+    _participant_index: Dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Memoized isoformat() strings keyed by field name; see iso().
+    _iso_cache: Dict[str, tuple[datetime, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Memoized roster text; see participant_mentions().
+    _participant_text: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Normalise timestamps to UTC-aware and build the participant index."""
+        self.end_time = _as_utc(self.end_time)
+        self.created_at = _as_utc(self.created_at)
+        index = {user_id: pos for pos, user_id in enumerate(self.participants)}
+        if len(index) != len(self.participants):
+            # Drop duplicate entries (possible in old data) so positions stay exact.
+            self.participants[:] = dict.fromkeys(self.participants)
+            index = {user_id: pos for pos, user_id in enumerate(self.participants)}
+        self._participant_index = index
 
     def add_participant(self, user_id: int) -> bool:
         """Add a participant if they are not already in the list."""
-        if user_id in self.participants:
+        if user_id in self._participant_index:
             return False
+        self._participant_index[user_id] = len(self.participants)
         self.participants.append(user_id)
+        self._participant_text = None
         return True
 
     def remove_participant(self, user_id: int) -> bool:
-        """Remove a participant if present."""
-        if user_id not in self.participants:
+        """Remove a participant if present.
+
+        The last participant is moved into the freed slot, so list order is
+        not preserved across removals.
+        """
+        pos = self._participant_index.pop(user_id, None)
+        if pos is None:
             return False
-        self.participants.remove(user_id)
+        last = self.participants.pop()
+        if last != user_id:
+            self.participants[pos] = last
+            self._participant_index[last] = pos
+        self._participant_text = None
         return True
 
+    def clear_participants(self) -> None:
+        """Drop every participant."""
+        self._participant_index.clear()
+        self.participants.clear()
+        self._participant_text = None
+
+    def participant_mentions(self) -> str:
+        """Return the roster as one ``- <@id>`` line per participant, cached until it changes."""
+        text = self._participant_text
+        if text is None:
+            text = self._participant_text = "\n".join(
+                f"- <@{user_id}>" for user_id in self.participants
+            )
+        return text
+
+    def end_time_local(self, tz: tzinfo) -> str:
+        """Return end_time formatted in ``tz``, cached until end_time or the timezone changes."""
+        cached = self._end_local
+        if cached is not None and cached[0] is self.end_time and cached[1] == tz:
+            return cached[2]
+        text = self.end_time.astimezone(tz).strftime("%Y-%m-%d %H:%M %Z")
+        self._end_local = (self.end_time, tz, text)
+        return text
+
     def to_payload(self) -> dict:
         """Serialize the giveaway to a JSON-serialisable structure."""
         return {
@@ -48,8 +188,8 @@ class Giveaway:
             "winners": self.winners,
             "title": self.title,
             "description": self.description,
-            "end_time": self.end_time.isoformat(),
-            "created_at": self.created_at.isoformat(),
+            "end_time": self.iso("end_time"),
+            "created_at": self.iso("created_at"),
             "participants": self.participants,
             "scheduled_id": self.scheduled_id,
             "is_active": self.is_active,
@@ -59,27 +199,28 @@ class Giveaway:
     @classmethod
     def from_payload(cls, payload: dict) -> "Giveaway":
         """Reconstruct a Giveaway from serialized payload data."""
+        # Arguments are positional (field order) to skip keyword handling.
+        participants = payload.get("participants", _MISSING)
+        last_winners = payload.get("last_announced_winners", _MISSING)
         return cls(
-            id=str(payload["id"]),
-            guild_id=int(payload["guild_id"]),
-            channel_id=int(payload["channel_id"]),
-            message_id=int(payload["message_id"]),
-            winners=int(payload["winners"]),
-            title=str(payload["title"]),
-            description=str(payload["description"]),
-            end_time=datetime.fromisoformat(payload["end_time"]),
-            created_at=datetime.fromisoformat(payload["created_at"]),
-            participants=list(map(int, payload.get("participants", []))),
-            scheduled_id=payload.get("scheduled_id"),
-            is_active=bool(payload.get("is_active", True)),
-            last_announced_winners=list(
-                map(int, payload.get("last_announced_winners", []))
-            ),
+            intern(str(payload["id"])),
+            int(payload["guild_id"]),
+            int(payload["channel_id"]),
+            int(payload["message_id"]),
+            int(payload["winners"]),
+            str(payload["title"]),
+            str(payload["description"]),
+            _parse_iso(payload["end_time"]),
+            _parse_iso(payload["created_at"]),
+            [] if participants is _MISSING else list(map(int, participants)),
+            _intern_opt(payload.get("scheduled_id")),
+            bool(payload.get("is_active", True)),
+            [] if last_winners is _MISSING else list(map(int, last_winners)),
         )
 
 
 @dataclass(slots=True)
-class PendingGiveaway:
+class PendingGiveaway(_IsoFormatted):
     """Represents a giveaway scheduled to start in the future."""
     id: str
     guild_id: int
@@ -89,6 +230,14 @@ class PendingGiveaway:
     description: str
     start_time: datetime
     end_time: datetime
+    _iso_cache: Dict[str, tuple[datetime, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Normalise the scheduled window to UTC-aware datetimes."""
+        self.start_time = _as_utc(self.start_time)
+        self.end_time = _as_utc(self.end_time)
 
     def to_payload(self) -> dict:
         """Serialize to a JSON-friendly mapping."""
@@ -99,50 +248,54 @@ class PendingGiveaway:
             "winners": self.winners,
             "title": self.title,
             "description": self.description,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
+            "start_time": self.iso("start_time"),
+            "end_time": self.iso("end_time"),
         }
 
     @classmethod
     def from_payload(cls, payload: dict) -> "PendingGiveaway":
         """Deserialize a pending giveaway from stored state."""
         return cls(
-            id=str(payload["id"]),
-            guild_id=int(payload["guild_id"]),
-            channel_id=int(payload["channel_id"]),
-            winners=int(payload["winners"]),
-            title=str(payload["title"]),
-            description=str(payload["description"]),
-            start_time=datetime.fromisoformat(payload["start_time"]),
-            end_time=datetime.fromisoformat(payload["end_time"]),
+            intern(str(payload["id"])),
+            int(payload["guild_id"]),
+            int(payload["channel_id"]),
+            int(payload["winners"]),
+            str(payload["title"]),
+            str(payload["description"]),
+            _parse_iso(payload["start_time"]),
+            _parse_iso(payload["end_time"]),
         )
 
 
 @dataclass(slots=True)
-class RecentWinner:
+class RecentWinner(_IsoFormatted):
     """Record of a winner used to enforce cooldown rules."""
     user_id: int
     giveaway_id: str
     won_at: datetime
+    _iso_cache: Dict[str, tuple[datetime, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Normalise the win timestamp to a UTC-aware datetime."""
+        self.won_at = _as_utc(self.won_at)
 
     def to_payload(self) -> dict:
         """Serialize the winner entry for storage."""
         return {
             "user_id": self.user_id,
             "giveaway_id": self.giveaway_id,
-            "won_at": self.won_at.isoformat(),
+            "won_at": self.iso("won_at"),
         }
 
     @classmethod
     def from_payload(cls, payload: dict) -> "RecentWinner":
         """Rehydrate a RecentWinner from stored JSON data."""
-        won_at = datetime.fromisoformat(payload["won_at"])
-        if won_at.tzinfo is None:
-            won_at = won_at.replace(tzinfo=UTC)
         return cls(
-            user_id=int(payload["user_id"]),
-            giveaway_id=str(payload.get("giveaway_id", "")),
-            won_at=won_at,
+            int(payload["user_id"]),
+            intern(str(payload.get("giveaway_id", ""))),
+            _parse_iso(payload["won_at"]),
         )
 
 
@@ -153,13 +306,41 @@ class GuildState:
     timezone: str = "Europe/Berlin"
     logger_channel_id: Optional[int] = None
     schedule_runs: Dict[str, str] = field(default_factory=dict)
-    giveaways: List[Giveaway] = field(default_factory=list)
-    pending_giveaways: List[PendingGiveaway] = field(default_factory=list)
-    recurring_giveaways: List["RecurringGiveaway"] = field(default_factory=list)
+    # Giveaway collections are keyed by id; dict order preserves insertion order.
+    giveaways: Dict[str, Giveaway] = field(default_factory=dict)
+    pending_giveaways: Dict[str, PendingGiveaway] = field(default_factory=dict)
+    recurring_giveaways: Dict[str, "RecurringGiveaway"] = field(default_factory=dict)
     admin_roles: List[int] = field(default_factory=list)
     recent_winner_cooldown_enabled: bool = False
     recent_winner_cooldown_days: int = 0
     recent_winners: List[RecentWinner] = field(default_factory=list)
+    _all_cache: Optional[tuple[Giveaway, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _active_cache: Optional[tuple[Giveaway, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def all_giveaways(self) -> tuple[Giveaway, ...]:
+        """Return every giveaway, reusing the cached tuple until the set changes."""
+        cached = self._all_cache
+        if cached is None:
+            cached = self._all_cache = tuple(self.giveaways.values())
+        return cached
+
+    def active_giveaways(self) -> tuple[Giveaway, ...]:
+        """Return active giveaways, reusing the cached tuple until the set changes."""
+        cached = self._active_cache
+        if cached is None:
+            cached = self._active_cache = tuple(
+                g for g in self.giveaways.values() if g.is_active
+            )
+        return cached
+
+    def invalidate_giveaways(self) -> None:
+        """Drop the cached tuples after giveaways are added, removed or ended."""
+        self._all_cache = None
+        self._active_cache = None
 
     def to_payload(self) -> dict:
         """Serialize guild state for persistence."""
@@ -168,9 +349,9 @@ class GuildState:
             "timezone": self.timezone,
             "logger_channel_id": self.logger_channel_id,
             "schedule_runs": self.schedule_runs,
-            "giveaways": [g.to_payload() for g in self.giveaways],
-            "pending_giveaways": [p.to_payload() for p in self.pending_giveaways],
-            "recurring_giveaways": [r.to_payload() for r in self.recurring_giveaways],
+            "giveaways": [g.to_payload() for g in self.giveaways.values()],
+            "pending_giveaways": [p.to_payload() for p in self.pending_giveaways.values()],
+            "recurring_giveaways": [r.to_payload() for r in self.recurring_giveaways.values()],
             "admin_roles": self.admin_roles,
             "recent_winner_cooldown_enabled": self.recent_winner_cooldown_enabled,
             "recent_winner_cooldown_days": self.recent_winner_cooldown_days,
@@ -180,38 +361,50 @@ class GuildState:
     @classmethod
     def from_payload(cls, payload: dict) -> "GuildState":
         """Deserialize guild state from JSON-friendly data."""
-        giveaways_payload = payload.get("giveaways", [])
-        giveaways = [Giveaway.from_payload(g) for g in giveaways_payload]
-        pending_payload = payload.get("pending_giveaways", [])
-        pending = [PendingGiveaway.from_payload(p) for p in pending_payload]
-        recurring_payload = payload.get("recurring_giveaways", [])
-        recurring = [RecurringGiveaway.from_payload(r) for r in recurring_payload]
+        giveaways = _index_by_id(
+            map(Giveaway.from_payload, payload.get("giveaways", ()))
+        )
+        pending = _index_by_id(
+            map(PendingGiveaway.from_payload, payload.get("pending_giveaways", ()))
+        )
+        recurring = _index_by_id(
+            map(RecurringGiveaway.from_payload, payload.get("recurring_giveaways", ()))
+        )
         recent_winners_payload = payload.get("recent_winners", [])
-        recent_winners = []
-        for entry in recent_winners_payload:
-            try:
-                recent_winners.append(RecentWinner.from_payload(entry))
-            except Exception:
-                continue
+        try:
+            recent_winners = [
+                RecentWinner.from_payload(entry)
+                for entry in recent_winners_payload
+                if "user_id" in entry and "won_at" in entry
+            ]
+        except Exception:
+            # Fall back to per-entry parsing so one malformed entry is skipped
+            # rather than discarding the whole history.
+            recent_winners = []
+            for entry in recent_winners_payload:
+                try:
+                    recent_winners.append(RecentWinner.from_payload(entry))
+                except Exception:
+                    continue
         try:
             cooldown_days_value = int(payload.get("recent_winner_cooldown_days", 0) or 0)
         except (TypeError, ValueError):
             cooldown_days_value = 0
 
+        schedule_runs = payload.get("schedule_runs", _MISSING)
+        admin_roles = payload.get("admin_roles", _MISSING)
         return cls(
-            auto_enabled=bool(payload.get("auto_enabled", True)),
-            timezone=payload.get("timezone", "Europe/Berlin"),
-            logger_channel_id=payload.get("logger_channel_id"),
-            schedule_runs=dict(payload.get("schedule_runs", {})),
-            giveaways=giveaways,
-            pending_giveaways=pending,
-            recurring_giveaways=recurring,
-            admin_roles=[int(r) for r in payload.get("admin_roles", [])],
-            recent_winner_cooldown_enabled=bool(
-                payload.get("recent_winner_cooldown_enabled", False)
-            ),
-            recent_winner_cooldown_days=cooldown_days_value,
-            recent_winners=recent_winners,
+            bool(payload.get("auto_enabled", True)),
+            payload.get("timezone", "Europe/Berlin"),
+            payload.get("logger_channel_id"),
+            {} if schedule_runs is _MISSING else dict(schedule_runs),
+            giveaways,
+            pending,
+            recurring,
+            [] if admin_roles is _MISSING else [int(r) for r in admin_roles],
+            bool(payload.get("recent_winner_cooldown_enabled", False)),
+            cooldown_days_value,
+            recent_winners,
         )
 
 
@@ -243,49 +436,42 @@ class BotState:
                 guilds[guild_id] = GuildState.from_payload(guild_payload or {})
             return cls(guilds=guilds)
 
-        # Legacy flat payload migration
-        legacy_state = GuildState(
-            auto_enabled=bool(payload.get("auto_enabled", True)),
-            timezone=payload.get("timezone", "Europe/Berlin"),
-            logger_channel_id=payload.get("logger_channel_id"),
-            schedule_runs=dict(payload.get("schedule_runs", {})),
-            giveaways=[Giveaway.from_payload(g) for g in payload.get("giveaways", [])],
-            pending_giveaways=[
-                PendingGiveaway.from_payload(p)
-                for p in payload.get("pending_giveaways", [])
-            ],
-            recurring_giveaways=[
-                RecurringGiveaway.from_payload(r)
-                for r in payload.get("recurring_giveaways", [])
-            ],
-            admin_roles=[int(r) for r in payload.get("admin_roles", [])],
-        )
-
-        guilds: Dict[int, GuildState] = {}
-        for giveaway in legacy_state.giveaways:
-            guilds.setdefault(giveaway.guild_id, GuildState()).giveaways.append(
-                giveaway
-            )
-        for pending in legacy_state.pending_giveaways:
-            guilds.setdefault(pending.guild_id, GuildState()).pending_giveaways.append(
-                pending
-            )
-        for recurring in legacy_state.recurring_giveaways:
-            guilds.setdefault(recurring.guild_id, GuildState()).recurring_giveaways.append(
-                recurring
+        # Legacy flat payload migration: settings were global, so every guild
+        # bucket starts from the same values and entries are routed by guild_id
+        # in a single pass per collection.
+        auto_enabled = bool(payload.get("auto_enabled", True))
+        timezone = payload.get("timezone", "Europe/Berlin")
+        logger_channel_id = payload.get("logger_channel_id")
+        schedule_runs = dict(payload.get("schedule_runs", {}))
+        admin_roles = [int(r) for r in payload.get("admin_roles", [])]
+
+        def _new_guild_state() -> GuildState:
+            return GuildState(
+                auto_enabled=auto_enabled,
+                timezone=timezone,
+                logger_channel_id=logger_channel_id,
+                schedule_runs=dict(schedule_runs),
+                admin_roles=list(admin_roles),
             )
 
+        guilds = {}
+
+        def _bucket(guild_id: int) -> GuildState:
+            state = guilds.get(guild_id)
+            if state is None:
+                state = guilds[guild_id] = _new_guild_state()
+            return state
+
+        for giveaway in map(Giveaway.from_payload, payload.get("giveaways", ())):
+            _bucket(giveaway.guild_id).giveaways[giveaway.id] = giveaway
+        for pending in map(PendingGiveaway.from_payload, payload.get("pending_giveaways", ())):
+            _bucket(pending.guild_id).pending_giveaways[pending.id] = pending
+        for recurring in map(RecurringGiveaway.from_payload, payload.get("recurring_giveaways", ())):
+            _bucket(recurring.guild_id).recurring_giveaways[recurring.id] = recurring
+
         if not guilds:
             # No giveaway data; keep a default guild-less state
-            guilds[0] = legacy_state
-        else:
-            for guild_state in guilds.values():
-                guild_state.admin_roles = list(legacy_state.admin_roles)
-                guild_state.auto_enabled = legacy_state.auto_enabled
-                guild_state.timezone = legacy_state.timezone
-                guild_state.logger_channel_id = legacy_state.logger_channel_id
-                guild_state.schedule_runs = dict(legacy_state.schedule_runs)
-
+            guilds[0] = _new_guild_state()
         return cls(guilds=guilds)
 
     def ensure_guild_state(
@@ -296,15 +482,9 @@ class BotState:
         if state is None:
             roles: List[int] = []
             if default_admin_roles:
-                seen: set[int] = set()
-                for role in default_admin_roles:
-                    try:
-                        role_id = int(role)
-                    except (TypeError, ValueError):
-                        continue
-                    if role_id not in seen:
-                        seen.add(role_id)
-                        roles.append(role_id)
+                # dict.fromkeys dedupes in C while keeping first-seen order.
+                coerced = map(_coerce_role_id, default_admin_roles)
+                roles = list(dict.fromkeys(r for r in coerced if r is not None))
             state = GuildState(admin_roles=roles)
             self.guilds[guild_id] = state
         return state
@@ -313,128 +493,106 @@ class BotState:
         """Fetch a guild state by ID, returning None when unknown."""
         return self.guilds.get(guild_id)
 
-    def iter_guild_states(self) -> Iterable[tuple[int, GuildState]]:
-        """Iterate over (guild_id, state) pairs."""
-        return tuple(self.guilds.items())
+    def iter_guild_states(self) -> ItemsView[int, GuildState]:
+        """Iterate over (guild_id, state) pairs.
+
+        This is a live view; callers that add or remove guilds while iterating
+        must snapshot it first.
+        """
+        return self.guilds.items()
 
     def upsert_giveaway(self, giveaway: Giveaway) -> None:
         """Insert or update a giveaway within the appropriate guild state."""
         state = self.ensure_guild_state(giveaway.guild_id)
-        for idx, item in enumerate(state.giveaways):
-            if item.id == giveaway.id:
-                state.giveaways[idx] = giveaway
-                return
-        state.giveaways.append(giveaway)
+        state.giveaways[giveaway.id] = giveaway
+        state.invalidate_giveaways()
 
     def remove_giveaway(self, guild_id: int, giveaway_id: str) -> Optional[Giveaway]:
         """Remove and return a giveaway if it exists."""
         state = self.get_guild_state(guild_id)
         if not state:
             return None
-        for idx, item in enumerate(state.giveaways):
-            if item.id == giveaway_id:
-                return state.giveaways.pop(idx)
-        return None
+        removed = state.giveaways.pop(giveaway_id, None)
+        if removed is not None:
+            state.invalidate_giveaways()
+        return removed
 
     def get_giveaway(self, guild_id: int, giveaway_id: str) -> Optional[Giveaway]:
         """Retrieve a giveaway by ID."""
         state = self.get_guild_state(guild_id)
         if not state:
             return None
-        for item in state.giveaways:
-            if item.id == giveaway_id:
-                return item
-        return None
+        return state.giveaways.get(giveaway_id)
 
-    def list_active(self, guild_id: int) -> List[Giveaway]:
+    def list_active(self, guild_id: int) -> Sequence[Giveaway]:
         """Return giveaways that are still active for the specified guild."""
         state = self.get_guild_state(guild_id)
         if not state:
-            return []
-        return [g for g in state.giveaways if g.is_active]
+            return ()
+        return state.active_giveaways()
 
     def list_all(self, guild_id: int) -> Sequence[Giveaway]:
         """Return all giveaways tracked for a guild."""
         state = self.get_guild_state(guild_id)
         if not state:
             return ()
-        return tuple(state.giveaways)
+        return state.all_giveaways()
 
     def get_pending(self, guild_id: int, pending_id: str) -> Optional[PendingGiveaway]:
         """Fetch a pending giveaway awaiting start."""
         state = self.get_guild_state(guild_id)
         if not state:
             return None
-        for item in state.pending_giveaways:
-            if item.id == pending_id:
-                return item
-        return None
+        return state.pending_giveaways.get(pending_id)
 
     def upsert_pending(self, guild_id: int, pending: PendingGiveaway) -> None:
         """Insert or update a pending giveaway."""
         state = self.ensure_guild_state(guild_id)
-        for idx, item in enumerate(state.pending_giveaways):
-            if item.id == pending.id:
-                state.pending_giveaways[idx] = pending
-                return
-        state.pending_giveaways.append(pending)
+        state.pending_giveaways[pending.id] = pending
 
     def remove_pending(self, guild_id: int, pending_id: str) -> Optional[PendingGiveaway]:
         """Remove a pending giveaway by ID."""
         state = self.get_guild_state(guild_id)
         if not state:
             return None
-        for idx, item in enumerate(state.pending_giveaways):
-            if item.id == pending_id:
-                return state.pending_giveaways.pop(idx)
-        return None
+        return state.pending_giveaways.pop(pending_id, None)
 
     def list_pending(self, guild_id: int) -> Sequence[PendingGiveaway]:
         """Return all pending giveaways for a guild."""
         state = self.get_guild_state(guild_id)
         if not state:
             return ()
-        return tuple(state.pending_giveaways)
+        return tuple(state.pending_giveaways.values())
 
     def get_recurring(self, guild_id: int, schedule_id: str) -> Optional["RecurringGiveaway"]:
         """Retrieve a recurring giveaway definition."""
         state = self.get_guild_state(guild_id)
         if not state:
             return None
-        for item in state.recurring_giveaways:
-            if item.id == schedule_id:
-                return item
-        return None
+        return state.recurring_giveaways.get(schedule_id)
 
     def upsert_recurring(self, guild_id: int, recurring: "RecurringGiveaway") -> None:
         """Insert or update a recurring giveaway schedule."""
         state = self.ensure_guild_state(guild_id)
-        for idx, item in enumerate(state.recurring_giveaways):
-            if item.id == recurring.id:
-                state.recurring_giveaways[idx] = recurring
-                return
-        state.recurring_giveaways.append(recurring)
+        state.recurring_giveaways[recurring.id] = recurring
 
     def remove_recurring(self, guild_id: int, schedule_id: str) -> Optional["RecurringGiveaway"]:
         """Delete a recurring schedule if present."""
         state = self.get_guild_state(guild_id)
         if not state:
             return None
-        for idx, item in enumerate(state.recurring_giveaways):
-            if item.id == schedule_id:
-                return state.recurring_giveaways.pop(idx)
-        return None
+        return state.recurring_giveaways.pop(schedule_id, None)
 
     def list_recurring(self, guild_id: int) -> Sequence["RecurringGiveaway"]:
         """Return all recurring schedules for a guild."""
         state = self.get_guild_state(guild_id)
         if not state:
             return ()
-        return tuple(state.recurring_giveaways)
+        return tuple(state.recurring_giveaways.values())
 
 
 @dataclass(slots=True)
-class RecurringGiveaway:
+class RecurringGiveaway(_IsoFormatted):
     """Represents a giveaway template that runs daily within a defined window."""
     id: str
     guild_id: int
@@ -447,6 +605,14 @@ class RecurringGiveaway:
     next_start: datetime
     next_end: datetime
     enabled: bool = True
+    _iso_cache: Dict[str, tuple[datetime, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Normalise the next run window to UTC-aware datetimes."""
+        self.next_start = _as_utc(self.next_start)
+        self.next_end = _as_utc(self.next_end)
 
     def to_payload(self) -> dict:
         """Serialize the recurring schedule for storage."""
@@ -459,8 +625,8 @@ class RecurringGiveaway:
             "description": self.description,
             "start_time": self.start_time.strftime("%H:%M"),
             "end_time": self.end_time.strftime("%H:%M"),
-            "next_start": self.next_start.isoformat(),
-            "next_end": self.next_end.isoformat(),
+            "next_start": self.iso("next_start"),
+            "next_end": self.iso("next_end"),
             "enabled": self.enabled,
         }
 
@@ -469,18 +635,18 @@ class RecurringGiveaway:
         """Construct a RecurringGiveaway from persisted data."""
         start_time_value = payload.get("start_time", "00:00")
         end_time_value = payload.get("end_time", "00:00")
-        start_time_obj = datetime.strptime(start_time_value, "%H:%M").time()
-        end_time_obj = datetime.strptime(end_time_value, "%H:%M").time()
+        start_time_obj = _parse_hhmm(start_time_value)
+        end_time_obj = _parse_hhmm(end_time_value)
         return cls(
-            id=str(payload["id"]),
-            guild_id=int(payload["guild_id"]),
-            channel_id=int(payload["channel_id"]),
-            winners=int(payload["winners"]),
-            title=str(payload["title"]),
-            description=str(payload["description"]),
-            start_time=start_time_obj,
-            end_time=end_time_obj,
-            next_start=datetime.fromisoformat(payload["next_start"]),
-            next_end=datetime.fromisoformat(payload["next_end"]),
-            enabled=bool(payload.get("enabled", True)),
+            intern(str(payload["id"])),
+            int(payload["guild_id"]),
+            int(payload["channel_id"]),
+            int(payload["winners"]),
+            str(payload["title"]),
+            str(payload["description"]),
+            start_time_obj,
+            end_time_obj,
+            _parse_iso(payload["next_start"]),
+            _parse_iso(payload["next_end"]),
+            bool(payload.get("enabled", True)),
         )
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import json
 import logging
-import re
 import sqlite3
-from datetime import datetime
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from sys import intern
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
 
 from .models import (
     BotState,
@@ -17,10 +24,131 @@ from .models import (
     PendingGiveaway,
     RecentWinner,
     RecurringGiveaway,
+    _intern_opt,
+    _parse_hhmm,
+    _parse_iso,
+    _seed_isoformat,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json is the fallback.
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Seconds the background writer waits after a save so bursts collapse into one write.
+_SAVE_DELAY = 0.25
+# Minimum seconds between PRAGMA optimize runs over the open guild databases.
+_OPTIMIZE_INTERVAL = 15 * 60
+# Most guild connections kept open between saves. Each WAL connection holds
+# three file descriptors, so the pool stays far below the usual 1024 limit.
+_MAX_OPEN_CONNS = 64
+
+if orjson is not None:
+
+    def _json_dumps(value: object) -> str:
+        """Encode a value as JSON text for a TEXT column."""
+        return orjson.dumps(value).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+async def _to_thread_fast(func: Callable[..., _T], *args: object) -> _T:
+    """Run ``func`` on the default executor like asyncio.to_thread.
+
+    When no context variables are set there is nothing to propagate, so the
+    ``ctx.run`` wrapper is skipped.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    if not ctx:
+        return await loop.run_in_executor(None, func, *args)
+    return await loop.run_in_executor(None, functools.partial(ctx.run, func, *args))
+
+
+@dataclass(slots=True)
+class _Table:
+    """Statements for one guild table, in the column order of StateStorage._guild_rows."""
+    name: str
+    columns: tuple[str, ...]
+    # Number of leading columns forming the primary key; 0 means rows are
+    # identified by all of their columns.
+    key_len: int
+    insert: str = field(init=False)
+    upsert: str = field(init=False)
+    delete: str = field(init=False)
+    clear: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        columns = ", ".join(self.columns)
+        placeholders = ", ".join("?" * len(self.columns))
+        insert = f"INSERT INTO {self.name}({columns}) VALUES ({placeholders})"
+        key_columns = self.columns[: self.key_len] if self.key_len else self.columns
+        if self.key_len:
+            updates = ", ".join(f"{c} = excluded.{c}" for c in self.columns[self.key_len :])
+            action = f"UPDATE SET {updates}" if updates else "NOTHING"
+            upsert = f"{insert} ON CONFLICT({', '.join(key_columns)}) DO {action}"
+        else:
+            upsert = insert
+        where = " AND ".join(f"{c} = ?" for c in key_columns)
+        self.insert = insert
+        self.upsert = upsert
+        self.delete = f"DELETE FROM {self.name} WHERE {where}"
+        self.clear = f"DELETE FROM {self.name}"
+
+
+_TABLES = (
+    _Table("metadata", ("key", "value"), 1),
+    _Table("schedule_runs", ("schedule_id", "last_run"), 1),
+    _Table("admin_roles", ("role_id",), 1),
+    _Table(
+        "giveaways",
+        (
+            "id",
+            "channel_id",
+            "message_id",
+            "winners",
+            "title",
+            "description",
+            "end_time",
+            "created_at",
+            "scheduled_id",
+            "is_active",
+        ),
+        1,
+    ),
+    _Table("giveaway_participants", ("giveaway_id", "user_id", "position"), 2),
+    _Table("giveaway_last_winners", ("giveaway_id", "user_id", "position"), 2),
+    _Table(
+        "pending_giveaways",
+        ("id", "channel_id", "winners", "title", "description", "start_time", "end_time"),
+        1,
+    ),
+    _Table(
+        "recurring_giveaways",
+        (
+            "id",
+            "channel_id",
+            "winners",
+            "title",
+            "description",
+            "start_time",
+            "end_time",
+            "next_start",
+            "next_end",
+            "enabled",
+        ),
+        1,
+    ),
+    _Table("recent_winners", ("user_id", "giveaway_id", "won_at"), 0),
+)
+
 
 class StateStorage:
     """Async wrapper around per-guild SQLite databases for bot state."""
@@ -31,6 +159,18 @@ class StateStorage:
         self.guilds_dir = self.base_dir / "guilds"
         self.legacy_path = self.base_dir / "state.json"
         self._lock = asyncio.Lock()
+        # Rows last written (or loaded) per guild, used to skip unchanged guilds on save.
+        self._written_rows: Dict[int, tuple[tuple, ...]] = {}
+        # Saves are coalesced: only the most recent state handed to save() is written.
+        self._pending: Optional[BotState] = None
+        self._dirty = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._closing = False
+        # Open connections per guild database, reused across saves and kept in
+        # least-recently-used order (see _get_conn). Access is serialised by
+        # self._lock, so the worker threads never share one concurrently.
+        self._conns: OrderedDict[int, sqlite3.Connection] = OrderedDict()
+        self._last_optimize = time.monotonic()
 
     async def load(self) -> BotState:
         """Load bot state from per-guild SQLite databases (migrating legacy JSON)."""
@@ -39,33 +179,103 @@ class StateStorage:
 
             if self.legacy_path.exists():
                 LOGGER.info("Migrating legacy JSON state to per-guild SQLite databases.")
-                legacy_data = await asyncio.to_thread(self.legacy_path.read_text, encoding="utf-8")
-                payload = json.loads(legacy_data)
+                legacy_data = await _to_thread_fast(self.legacy_path.read_bytes)
+                payload = _json_loads(legacy_data)
                 state = BotState.from_payload(payload)
-                await asyncio.to_thread(self._write_all_guilds, state)
+                await _to_thread_fast(self._write_all_guilds, self._snapshot_rows(state))
                 backup = self.legacy_path.with_suffix(".json.bak")
                 self.legacy_path.replace(backup)
                 LOGGER.info("Legacy state migrated; backup saved to %s", backup)
                 return state
 
-            state = BotState()
+            entries = []
             for db_path in self.guilds_dir.glob("guild_*.sqlite"):
                 guild_id = self._guild_id_from_path(db_path)
-                if guild_id is None:
-                    continue
-                guild_state = await asyncio.to_thread(self._read_guild_db, db_path, guild_id)
+                if guild_id is not None:
+                    entries.append((guild_id, db_path))
+            # Each guild is a separate database file with its own connection, so
+            # the reads run side by side on the default executor.
+            guild_states = await asyncio.gather(
+                *(
+                    _to_thread_fast(self._read_guild_db, guild_id, db_path)
+                    for guild_id, db_path in entries
+                )
+            )
+            state = BotState()
+            for (guild_id, db_path), guild_state in zip(entries, guild_states):
                 state.guilds[guild_id] = guild_state
+                if db_path == self._guild_path(guild_id):
+                    self._written_rows[guild_id] = self._guild_rows(guild_state)
+                else:
+                    # State read from a non-canonical file (e.g. zero-padded id)
+                    # is not on disk under _guild_path yet; leave no snapshot so
+                    # the next save rewrites the canonical file in full before
+                    # the stale one is removed.
+                    self._written_rows.pop(guild_id, None)
             return state
 
     async def save(self, state: BotState) -> None:
-        """Persist the provided bot state to the respective guild databases."""
-        async with self._lock:
-            self.guilds_dir.mkdir(parents=True, exist_ok=True)
-            await asyncio.to_thread(self._write_all_guilds, state)
+        """Schedule the provided bot state to be persisted by the background writer.
+
+        Saves arriving within ``_SAVE_DELAY`` seconds of each other are coalesced
+        into a single write of the latest state. Use ``flush`` to wait for it.
+        """
+        self._pending = state
+        self._dirty.set()
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._writer_loop())
 
     async def overwrite(self, state: BotState) -> None:
-        """Alias for save, provided for semantic clarity when replacing state."""
-        await self.save(state)
+        """Persist the provided state immediately, replacing what is on disk."""
+        self._pending = state
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write any pending state now and wait for it to reach disk."""
+        async with self._lock:
+            state, self._pending = self._pending, None
+            if state is None:
+                return
+            self.guilds_dir.mkdir(parents=True, exist_ok=True)
+            # Rows are built on the event loop so the worker thread never reads
+            # models that command handlers may be mutating.
+            try:
+                await _to_thread_fast(self._write_all_guilds, self._snapshot_rows(state))
+            except BaseException:
+                # Keep the unwritten state for the next flush unless a newer save
+                # has already replaced it.
+                if self._pending is None:
+                    self._pending = state
+                raise
+            if time.monotonic() - self._last_optimize >= _OPTIMIZE_INTERVAL:
+                self._last_optimize = time.monotonic()
+                await _to_thread_fast(self._optimize_all)
+
+    async def close(self) -> None:
+        """Stop the background writer, flush outstanding state and close databases."""
+        # The writer is never cancelled: a cancelled flush would leave its worker
+        # thread writing while the connections below are closed. Instead it is
+        # woken, finishes any in-flight write and exits on its own.
+        self._closing = True
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            self._dirty.set()
+            await writer
+        await self.flush()
+        async with self._lock:
+            for guild_id in list(self._conns):
+                self._close_conn(guild_id)
+
+    async def _writer_loop(self) -> None:
+        while not self._closing:
+            await self._dirty.wait()
+            if not self._closing:
+                await asyncio.sleep(_SAVE_DELAY)
+            self._dirty.clear()
+            try:
+                await self.flush()
+            except Exception:
+                LOGGER.exception("Failed to persist guild state; retrying on next save.")
 
     # --- Internal helpers -------------------------------------------------
 
@@ -74,273 +284,418 @@ class StateStorage:
 
     @staticmethod
     def _guild_id_from_path(path: Path) -> int | None:
-        match = re.match(r"guild_(\d+)\.sqlite$", path.name)
-        if not match:
+        # Fixed prefix/suffix checks; no regex needed for guild_<digits>.sqlite.
+        name = path.name
+        if not (name.startswith("guild_") and name.endswith(".sqlite")):
             return None
-        try:
-            return int(match.group(1))
-        except ValueError:
+        digits = name[6:-7]
+        if not digits.isdecimal():
             return None
+        return int(digits)
+
+    @classmethod
+    def _open_conn(cls, path: Path) -> sqlite3.Connection:
+        # Autocommit mode: transactions are only the explicit BEGIN IMMEDIATE
+        # blocks, so the driver never opens (or upgrades) one implicitly. The
+        # statement cache is sized to keep every _TABLES and read statement
+        # prepared for the life of the connection.
+        conn = sqlite3.connect(
+            path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        cls._ensure_schema(conn)
+        return conn
+
+    def _get_conn(self, guild_id: int) -> sqlite3.Connection:
+        conn = self._conns.get(guild_id)
+        if conn is not None:
+            self._conns.move_to_end(guild_id)
+            return conn
+        self._trim_conns(_MAX_OPEN_CONNS - 1)
+        conn = self._conns[guild_id] = self._open_conn(self._guild_path(guild_id))
+        return conn
+
+    def _trim_conns(self, limit: int = _MAX_OPEN_CONNS) -> None:
+        # Close least recently used connections until at most ``limit`` remain.
+        # Ones with an open transaction belong to the write batch in progress and
+        # are kept; _write_all_guilds trims again once the batch has committed.
+        excess = len(self._conns) - limit
+        for guild_id, conn in list(self._conns.items()):
+            if excess <= 0:
+                break
+            if not conn.in_transaction:
+                self._close_conn(guild_id)
+                excess -= 1
+
+    def _close_conn(self, guild_id: int) -> None:
+        conn = self._conns.pop(guild_id, None)
+        if conn is not None:
+            conn.close()
 
-    def _write_all_guilds(self, state: BotState) -> None:
-        guild_items = list(state.iter_guild_states())
-        expected_paths = {self._guild_path(guild_id).resolve() for guild_id, _ in guild_items}
-        for guild_id, guild_state in guild_items:
-            self._write_guild_db(self._guild_path(guild_id), guild_id, guild_state)
-
-        existing_paths = {path.resolve() for path in self.guilds_dir.glob("guild_*.sqlite")}
-        for stale_path in existing_paths - expected_paths:
+    def _optimize_all(self) -> None:
+        for guild_id, conn in list(self._conns.items()):
             try:
-                Path(stale_path).unlink()
-            except OSError as exc:
-                LOGGER.warning("Unable to remove stale guild database %s: %s", stale_path, exc)
-
-    def _write_guild_db(self, path: Path, guild_id: int, guild_state: GuildState) -> None:
-        conn = sqlite3.connect(path)
+                conn.execute("PRAGMA optimize;")
+            except sqlite3.Error as exc:
+                LOGGER.warning("PRAGMA optimize failed for guild %s: %s", guild_id, exc)
+
+    def _snapshot_rows(self, state: BotState) -> Dict[int, tuple[tuple, ...]]:
+        return {
+            guild_id: self._guild_rows(guild_state)
+            for guild_id, guild_state in state.iter_guild_states()
+        }
+
+    def _write_all_guilds(self, guild_rows: Dict[int, tuple[tuple, ...]]) -> None:
+        # Every guild database lives directly in guilds_dir, so file names are
+        # enough to tell stale files apart; no resolve() stat calls are needed.
+        expected_names = {self._guild_path(guild_id).name for guild_id in guild_rows}
+        # Every changed guild is written inside its own open transaction first;
+        # the commits then run back to back, and any failure rolls back the
+        # guilds that have not been committed yet.
+        open_txns: list[tuple[int, sqlite3.Connection, tuple[tuple, ...]]] = []
+        committed = 0
         try:
-            self._ensure_schema(conn)
-            conn.execute("BEGIN")
-
-            conn.execute("DELETE FROM metadata")
-            conn.execute("DELETE FROM schedule_runs")
-            conn.execute("DELETE FROM admin_roles")
-            conn.execute("DELETE FROM giveaways")
-            conn.execute("DELETE FROM pending_giveaways")
-            conn.execute("DELETE FROM recurring_giveaways")
-            conn.execute("DELETE FROM recent_winners")
-
-            meta_entries = [
-                ("auto_enabled", json.dumps(guild_state.auto_enabled)),
-                ("timezone", guild_state.timezone),
-                ("logger_channel_id", json.dumps(guild_state.logger_channel_id)),
-                ("recent_winner_cooldown_enabled", json.dumps(guild_state.recent_winner_cooldown_enabled)),
-                ("recent_winner_cooldown_days", json.dumps(guild_state.recent_winner_cooldown_days)),
-            ]
-            conn.executemany("INSERT INTO metadata(key, value) VALUES (?, ?)", meta_entries)
-
-            if guild_state.schedule_runs:
-                conn.executemany(
-                    "INSERT INTO schedule_runs(schedule_id, last_run) VALUES (?, ?)",
-                    [(schedule_id, last_run) for schedule_id, last_run in guild_state.schedule_runs.items()],
-                )
-
-            if guild_state.admin_roles:
-                conn.executemany(
-                    "INSERT INTO admin_roles(role_id) VALUES (?)",
-                    [(int(role_id),) for role_id in guild_state.admin_roles],
-                )
-
-            if guild_state.giveaways:
-                conn.executemany(
-                    """
-                    INSERT INTO giveaways(
-                        id,
-                        channel_id,
-                        message_id,
-                        winners,
-                        title,
-                        description,
-                        end_time,
-                        created_at,
-                        participants,
-                        scheduled_id,
-                        is_active,
-                        last_announced_winners
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        (
-                            giveaway.id,
-                            giveaway.channel_id,
-                            giveaway.message_id,
-                            giveaway.winners,
-                            giveaway.title,
-                            giveaway.description,
-                            giveaway.end_time.isoformat(),
-                            giveaway.created_at.isoformat(),
-                            json.dumps(list(map(int, giveaway.participants))),
-                            giveaway.scheduled_id,
-                            1 if giveaway.is_active else 0,
-                            json.dumps(list(map(int, giveaway.last_announced_winners))),
-                        )
-                        for giveaway in guild_state.giveaways
-                    ],
-                )
-
-            if guild_state.pending_giveaways:
-                conn.executemany(
-                    """
-                    INSERT INTO pending_giveaways(
-                        id,
-                        channel_id,
-                        winners,
-                        title,
-                        description,
-                        start_time,
-                        end_time
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        (
-                            pending.id,
-                            pending.channel_id,
-                            pending.winners,
-                            pending.title,
-                            pending.description,
-                            pending.start_time.isoformat(),
-                            pending.end_time.isoformat(),
-                        )
-                        for pending in guild_state.pending_giveaways
-                    ],
-                )
-
-            if guild_state.recurring_giveaways:
-                conn.executemany(
-                    """
-                    INSERT INTO recurring_giveaways(
-                        id,
-                        channel_id,
-                        winners,
-                        title,
-                        description,
-                        start_time,
-                        end_time,
-                        next_start,
-                        next_end,
-                        enabled
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        (
-                            recurring.id,
-                            recurring.channel_id,
-                            recurring.winners,
-                            recurring.title,
-                            recurring.description,
-                            recurring.start_time.strftime("%H:%M"),
-                            recurring.end_time.strftime("%H:%M"),
-                            recurring.next_start.isoformat(),
-                            recurring.next_end.isoformat(),
-                            1 if recurring.enabled else 0,
-                        )
-                        for recurring in guild_state.recurring_giveaways
-                    ],
-                )
-
-            if guild_state.recent_winners:
-                conn.executemany(
-                    "INSERT INTO recent_winners(user_id, giveaway_id, won_at) VALUES (?, ?, ?)",
-                    [
-                        (
-                            winner.user_id,
-                            winner.giveaway_id,
-                            winner.won_at.isoformat(),
-                        )
-                        for winner in guild_state.recent_winners
-                    ],
-                )
-
-            conn.commit()
+            for guild_id, rows in guild_rows.items():
+                path = self._guild_path(guild_id)
+                previous = self._written_rows.get(guild_id)
+                if not path.exists():
+                    # The file went away underneath us; reopen rather than write to
+                    # the unlinked inode, and rewrite it in full.
+                    self._close_conn(guild_id)
+                    previous = None
+                # Guilds whose rows match the last write are left untouched on disk.
+                elif previous == rows:
+                    continue
+                conn = self._get_conn(guild_id)
+                conn.execute("BEGIN IMMEDIATE")
+                open_txns.append((guild_id, conn, rows))
+                self._write_guild_db(conn, rows, previous)
+            for guild_id, conn, rows in open_txns:
+                conn.commit()
+                committed += 1
+                self._written_rows[guild_id] = rows
         except Exception:
-            conn.rollback()
+            for _, conn, _ in open_txns[committed:]:
+                conn.rollback()
             raise
         finally:
-            conn.close()
+            self._trim_conns()
+
+        for stale_path in list(self.guilds_dir.glob("guild_*.sqlite")):
+            if stale_path.name in expected_names:
+                continue
+            stale_id = self._guild_id_from_path(stale_path)
+            if stale_id is not None and stale_id not in guild_rows:
+                self._written_rows.pop(stale_id, None)
+                self._close_conn(stale_id)
+            try:
+                stale_path.unlink()
+            except OSError as exc:
+                LOGGER.warning("Unable to remove stale guild database %s: %s", stale_path, exc)
 
-    def _read_guild_db(self, path: Path, guild_id: int) -> GuildState:
-        conn = sqlite3.connect(path)
-        conn.row_factory = sqlite3.Row
+    @staticmethod
+    def _guild_rows(guild_state: GuildState) -> tuple[tuple, ...]:
+        """Flatten a guild state into the row tuples stored in each table."""
+        meta_entries = (
+            ("auto_enabled", _json_dumps(guild_state.auto_enabled)),
+            ("timezone", guild_state.timezone),
+            ("logger_channel_id", _json_dumps(guild_state.logger_channel_id)),
+            ("recent_winner_cooldown_enabled", _json_dumps(guild_state.recent_winner_cooldown_enabled)),
+            ("recent_winner_cooldown_days", _json_dumps(guild_state.recent_winner_cooldown_days)),
+        )
+        schedule_runs = tuple(guild_state.schedule_runs.items())
+        admin_roles = tuple((int(role_id),) for role_id in guild_state.admin_roles)
+        giveaways = tuple(
+            (
+                giveaway.id,
+                giveaway.channel_id,
+                giveaway.message_id,
+                giveaway.winners,
+                giveaway.title,
+                giveaway.description,
+                giveaway.iso("end_time"),
+                giveaway.iso("created_at"),
+                giveaway.scheduled_id,
+                1 if giveaway.is_active else 0,
+            )
+            for giveaway in guild_state.giveaways.values()
+        )
+        participants = tuple(
+            (giveaway.id, user_id, position)
+            for giveaway in guild_state.giveaways.values()
+            for position, user_id in enumerate(giveaway.participants)
+        )
+        last_winners = tuple(
+            (giveaway.id, user_id, position)
+            for giveaway in guild_state.giveaways.values()
+            for position, user_id in enumerate(giveaway.last_announced_winners)
+        )
+        pending_giveaways = tuple(
+            (
+                pending.id,
+                pending.channel_id,
+                pending.winners,
+                pending.title,
+                pending.description,
+                pending.iso("start_time"),
+                pending.iso("end_time"),
+            )
+            for pending in guild_state.pending_giveaways.values()
+        )
+        recurring_giveaways = tuple(
+            (
+                recurring.id,
+                recurring.channel_id,
+                recurring.winners,
+                recurring.title,
+                recurring.description,
+                recurring.start_time.strftime("%H:%M"),
+                recurring.end_time.strftime("%H:%M"),
+                recurring.iso("next_start"),
+                recurring.iso("next_end"),
+                1 if recurring.enabled else 0,
+            )
+            for recurring in guild_state.recurring_giveaways.values()
+        )
+        recent_winners = tuple(
+            (winner.user_id, winner.giveaway_id, winner.iso("won_at"))
+            for winner in guild_state.recent_winners
+        )
+        return (
+            meta_entries,
+            schedule_runs,
+            admin_roles,
+            giveaways,
+            participants,
+            last_winners,
+            pending_giveaways,
+            recurring_giveaways,
+            recent_winners,
+        )
+
+    @classmethod
+    def _write_guild_db(
+        cls,
+        conn: sqlite3.Connection,
+        rows: tuple[tuple, ...],
+        previous: Optional[tuple[tuple, ...]] = None,
+    ) -> None:
+        """Issue the statements for a guild's rows inside the caller's transaction.
+
+        Only rows that differ from ``previous`` are touched. Without ``previous``
+        (first write, or the file was recreated) every table is cleared and
+        rewritten.
+        """
+        for index, table in enumerate(_TABLES):
+            new_rows = rows[index]
+            if previous is None:
+                conn.execute(table.clear)
+                if new_rows:
+                    conn.executemany(table.insert, new_rows)
+                continue
+            old_rows = previous[index]
+            if old_rows != new_rows:
+                cls._apply_table_diff(conn, table, old_rows, new_rows)
+
+    @staticmethod
+    def _apply_table_diff(
+        conn: sqlite3.Connection, table: _Table, old_rows: tuple, new_rows: tuple
+    ) -> None:
+        if table.key_len:
+            key_len = table.key_len
+            old_by_key = {row[:key_len]: row for row in old_rows}
+            removed = old_by_key.keys() - {row[:key_len] for row in new_rows}
+            # executemany consumes the generator directly; no list of changed rows.
+            conn.executemany(
+                table.upsert,
+                (row for row in new_rows if old_by_key.get(row[:key_len]) != row),
+            )
+            if removed:
+                conn.executemany(table.delete, removed)
+            return
+
+        # Keyless tables (recent_winners) are diffed as sets of whole rows; exact
+        # duplicates cannot be told apart that way, so those fall back to a rewrite.
+        old_set = set(old_rows)
+        new_set = set(new_rows)
+        if len(old_set) != len(old_rows) or len(new_set) != len(new_rows):
+            conn.execute(table.clear)
+            if new_rows:
+                conn.executemany(table.insert, new_rows)
+            return
+        removed_rows = old_set - new_set
+        if removed_rows:
+            conn.executemany(table.delete, removed_rows)
+        conn.executemany(table.insert, (row for row in new_rows if row not in old_set))
+
+    def _read_guild_db(self, guild_id: int, path: Path) -> GuildState:
+        # Reads run concurrently during load(), outside the connection pool, so
+        # each uses its own short-lived connection; saves reopen pooled ones.
+        conn = self._open_conn(path)
+        # One cursor serves every SELECT below; each result set is fully
+        # consumed before the next execute() resets it.
+        cur = conn.cursor()
         try:
-            self._ensure_schema(conn)
             guild_state = GuildState()
 
-            metadata = {row["key"]: row["value"] for row in conn.execute("SELECT key, value FROM metadata")}
-            guild_state.auto_enabled = bool(json.loads(metadata.get("auto_enabled", "true")))
+            metadata = dict(cur.execute("SELECT key, value FROM metadata"))
+            guild_state.auto_enabled = bool(_json_loads(metadata.get("auto_enabled", "true")))
             guild_state.timezone = metadata.get("timezone", "Europe/Berlin")
-            guild_state.logger_channel_id = json.loads(metadata.get("logger_channel_id", "null"))
+            guild_state.logger_channel_id = _json_loads(metadata.get("logger_channel_id", "null"))
             guild_state.recent_winner_cooldown_enabled = bool(
-                json.loads(metadata.get("recent_winner_cooldown_enabled", "false"))
+                _json_loads(metadata.get("recent_winner_cooldown_enabled", "false"))
             )
-            guild_state.recent_winner_cooldown_days = int(json.loads(metadata.get("recent_winner_cooldown_days", "0")))
+            guild_state.recent_winner_cooldown_days = int(_json_loads(metadata.get("recent_winner_cooldown_days", "0")))
 
-            guild_state.schedule_runs = {
-                row["schedule_id"]: row["last_run"]
-                for row in conn.execute("SELECT schedule_id, last_run FROM schedule_runs")
-            }
-            guild_state.admin_roles = [int(row["role_id"]) for row in conn.execute("SELECT role_id FROM admin_roles")]
+            guild_state.schedule_runs = dict(cur.execute("SELECT schedule_id, last_run FROM schedule_runs"))
+            guild_state.admin_roles = [
+                int(role_id) for (role_id,) in cur.execute("SELECT role_id FROM admin_roles")
+            ]
 
-            for row in conn.execute("SELECT * FROM giveaways"):
-                participants = json.loads(row["participants"]) if row["participants"] else []
-                last_winners = json.loads(row["last_announced_winners"]) if row["last_announced_winners"] else []
-                giveaway = Giveaway(
-                    id=row["id"],
-                    guild_id=guild_id,
-                    channel_id=row["channel_id"],
-                    message_id=row["message_id"],
-                    winners=row["winners"],
-                    title=row["title"],
-                    description=row["description"],
-                    end_time=datetime.fromisoformat(row["end_time"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    participants=[int(value) for value in participants],
-                    scheduled_id=row["scheduled_id"],
-                    is_active=bool(row["is_active"]),
-                    last_announced_winners=[int(value) for value in last_winners],
+            participants_by_id = self._group_user_ids(
+                cur.execute(
+                    "SELECT giveaway_id, user_id FROM giveaway_participants"
+                    " ORDER BY giveaway_id, position"
+                )
+            )
+            last_winners_by_id = self._group_user_ids(
+                cur.execute(
+                    "SELECT giveaway_id, user_id FROM giveaway_last_winners"
+                    " ORDER BY giveaway_id, position"
                 )
-                guild_state.giveaways.append(giveaway)
+            )
 
-            for row in conn.execute("SELECT * FROM pending_giveaways"):
+            # Rows are plain tuples in the explicit column order of each SELECT.
+            # Ids are interned: they key the state dicts and are compared across
+            # giveaways, schedules and recent winners. Stored timestamp strings
+            # seed each model's iso() cache so unchanged rows are not reformatted.
+            for (
+                giveaway_id,
+                channel_id,
+                message_id,
+                winners,
+                title,
+                description,
+                end_text,
+                created_text,
+                scheduled_id,
+                is_active,
+            ) in cur.execute(
+                "SELECT id, channel_id, message_id, winners, title, description,"
+                " end_time, created_at, scheduled_id, is_active FROM giveaways"
+            ):
+                end_time, created_at = _parse_iso(end_text), _parse_iso(created_text)
+                giveaway = Giveaway(
+                    intern(giveaway_id),
+                    guild_id,
+                    channel_id,
+                    message_id,
+                    winners,
+                    title,
+                    description,
+                    end_time,
+                    created_at,
+                    participants_by_id.get(giveaway_id, []),
+                    _intern_opt(scheduled_id),
+                    bool(is_active),
+                    last_winners_by_id.get(giveaway_id, []),
+                )
+                _seed_isoformat(giveaway, "end_time", end_time, end_text)
+                _seed_isoformat(giveaway, "created_at", created_at, created_text)
+                guild_state.giveaways[giveaway.id] = giveaway
+
+            for (
+                pending_id,
+                channel_id,
+                winners,
+                title,
+                description,
+                start_text,
+                end_text,
+            ) in cur.execute(
+                "SELECT id, channel_id, winners, title, description, start_time, end_time"
+                " FROM pending_giveaways"
+            ):
+                start_time, end_time = _parse_iso(start_text), _parse_iso(end_text)
                 pending = PendingGiveaway(
-                    id=row["id"],
-                    guild_id=guild_id,
-                    channel_id=row["channel_id"],
-                    winners=row["winners"],
-                    title=row["title"],
-                    description=row["description"],
-                    start_time=datetime.fromisoformat(row["start_time"]),
-                    end_time=datetime.fromisoformat(row["end_time"]),
+                    intern(pending_id),
+                    guild_id,
+                    channel_id,
+                    winners,
+                    title,
+                    description,
+                    start_time,
+                    end_time,
                 )
-                guild_state.pending_giveaways.append(pending)
-
-            for row in conn.execute("SELECT * FROM recurring_giveaways"):
-                start_time_obj = datetime.strptime(row["start_time"], "%H:%M").time()
-                end_time_obj = datetime.strptime(row["end_time"], "%H:%M").time()
+                _seed_isoformat(pending, "start_time", start_time, start_text)
+                _seed_isoformat(pending, "end_time", end_time, end_text)
+                guild_state.pending_giveaways[pending.id] = pending
+
+            for (
+                schedule_id,
+                channel_id,
+                winners,
+                title,
+                description,
+                start_hhmm,
+                end_hhmm,
+                next_start_text,
+                next_end_text,
+                enabled,
+            ) in cur.execute(
+                "SELECT id, channel_id, winners, title, description, start_time, end_time,"
+                " next_start, next_end, enabled FROM recurring_giveaways"
+            ):
+                next_start, next_end = _parse_iso(next_start_text), _parse_iso(next_end_text)
                 recurring = RecurringGiveaway(
-                    id=row["id"],
-                    guild_id=guild_id,
-                    channel_id=row["channel_id"],
-                    winners=row["winners"],
-                    title=row["title"],
-                    description=row["description"],
-                    start_time=start_time_obj,
-                    end_time=end_time_obj,
-                    next_start=datetime.fromisoformat(row["next_start"]),
-                    next_end=datetime.fromisoformat(row["next_end"]),
-                    enabled=bool(row["enabled"]),
+                    intern(schedule_id),
+                    guild_id,
+                    channel_id,
+                    winners,
+                    title,
+                    description,
+                    _parse_hhmm(start_hhmm),
+                    _parse_hhmm(end_hhmm),
+                    next_start,
+                    next_end,
+                    bool(enabled),
                 )
-                guild_state.recurring_giveaways.append(recurring)
+                _seed_isoformat(recurring, "next_start", next_start, next_start_text)
+                _seed_isoformat(recurring, "next_end", next_end, next_end_text)
+                guild_state.recurring_giveaways[recurring.id] = recurring
 
-            for row in conn.execute(
+            for user_id, giveaway_id, won_text in cur.execute(
                 "SELECT user_id, giveaway_id, won_at FROM recent_winners ORDER BY won_at"
             ):
-                guild_state.recent_winners.append(
-                    RecentWinner(
-                        user_id=int(row["user_id"]),
-                        giveaway_id=row["giveaway_id"],
-                        won_at=datetime.fromisoformat(row["won_at"]),
-                    )
-                )
+                won_at = _parse_iso(won_text)
+                winner = RecentWinner(int(user_id), intern(giveaway_id), won_at)
+                _seed_isoformat(winner, "won_at", won_at, won_text)
+                guild_state.recent_winners.append(winner)
 
             return guild_state
         finally:
+            cur.close()
             conn.close()
 
+    @staticmethod
+    def _group_user_ids(rows: Iterable[tuple[str, int]]) -> Dict[str, List[int]]:
+        """Group ``(giveaway_id, user_id)`` rows sorted by giveaway into id lists."""
+        return {
+            giveaway_id: [row[1] for row in group]
+            for giveaway_id, group in groupby(rows, key=itemgetter(0))
+        }
+
     @staticmethod
     def _ensure_schema(conn: sqlite3.Connection) -> None:
         conn.execute("PRAGMA journal_mode=WAL;")
+        # WAL only needs an fsync at checkpoints when synchronous=NORMAL; the
+        # rest keeps temp data and hot pages in memory.
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA mmap_size=134217728;")
+        conn.execute("PRAGMA cache_size=-20000;")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS metadata (
@@ -375,13 +730,31 @@ class StateStorage:
                 description TEXT,
                 end_time TEXT NOT NULL,
                 created_at TEXT NOT NULL,
-                participants TEXT,
                 scheduled_id TEXT,
-                is_active INTEGER NOT NULL,
-                last_announced_winners TEXT
+                is_active INTEGER NOT NULL
             )
             """
         )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS giveaway_participants (
+                giveaway_id TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                PRIMARY KEY (giveaway_id, user_id)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS giveaway_last_winners (
+                giveaway_id TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                PRIMARY KEY (giveaway_id, user_id)
+            ) WITHOUT ROWID
+            """
+        )
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS pending_giveaways (
@@ -426,3 +799,43 @@ class StateStorage:
             ON recent_winners(won_at)
             """
         )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_recent_winners_user_won
+            ON recent_winners(user_id, won_at)
+            """
+        )
+        StateStorage._migrate_id_list_columns(conn)
+
+    @staticmethod
+    def _migrate_id_list_columns(conn: sqlite3.Connection) -> None:
+        """Move JSON participant/winner columns of older databases into the child tables."""
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= 1:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(giveaways)")}
+            if "participants" in columns:
+                legacy_rows = conn.execute(
+                    "SELECT id, participants, last_announced_winners FROM giveaways"
+                ).fetchall()
+                for giveaway_id, participants, last_winners in legacy_rows:
+                    for table, encoded in (
+                        ("giveaway_participants", participants),
+                        ("giveaway_last_winners", last_winners),
+                    ):
+                        if not encoded:
+                            continue
+                        conn.executemany(
+                            f"INSERT OR IGNORE INTO {table}(giveaway_id, user_id, position) VALUES (?, ?, ?)",
+                            (
+                                (giveaway_id, user_id, position)
+                                for position, user_id in enumerate(_json_loads(encoded))
+                            ),
+                        )
+                conn.execute("UPDATE giveaways SET participants = NULL, last_announced_winners = NULL")
+            conn.execute("PRAGMA user_version = 1")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
@@ -2,40 +2,57 @@
 
 from __future__ import annotations
 
+import io
+
 import discord
 
+# Discord rejects messages over 2000 characters; longer rosters go out as a file.
+_ROSTER_INLINE_LIMIT = 1900
+
+
+def participant_roster(giveaway) -> dict:
+    """Build ``send`` keyword arguments listing a giveaway's participants.
+
+    Short rosters are sent inline; long ones are attached as a text file so
+    the message stays within Discord's length limit.
+    """
+    header = f"Participants for **{giveaway.title}** (`{giveaway.id}`):"
+    mentions = giveaway.participant_mentions()
+    if len(header) + 1 + len(mentions) <= _ROSTER_INLINE_LIMIT:
+        return {"content": f"{header}\n{mentions}"}
+    return {
+        "content": f"{header} {len(giveaway.participants)} participant(s), see attachment.",
+        "file": discord.File(
+            io.BytesIO(mentions.encode()), filename=f"{giveaway.id}.txt"
+        ),
+    }
+
 
 class GiveawayView(discord.ui.View):
     """Persistent Discord view exposing join, leave, and info buttons."""
+
+    # (label, style, action); action names both the custom_id segment and the
+    # ``<action>_callback`` method the button is bound to.
+    _BUTTONS = (
+        ("Join 🎉", discord.ButtonStyle.success, "join"),
+        ("Leave", discord.ButtonStyle.secondary, "leave"),
+        ("Participants", discord.ButtonStyle.primary, "info"),
+    )
+
     def __init__(self, manager, giveaway_id: str) -> None:
         """Initialise the view for a specific giveaway id."""
         super().__init__(timeout=None)
         self.manager = manager
         self.giveaway_id = giveaway_id
 
-        join_button = discord.ui.Button(
-            label="Join 🎉",
-            style=discord.ButtonStyle.success,
-            custom_id=f"giveaway:join:{giveaway_id}",
-        )
-        join_button.callback = self.join_callback  # type: ignore[assignment]
-        self.add_item(join_button)
-
-        leave_button = discord.ui.Button(
-            label="Leave",
-            style=discord.ButtonStyle.secondary,
-            custom_id=f"giveaway:leave:{giveaway_id}",
-        )
-        leave_button.callback = self.leave_callback  # type: ignore[assignment]
-        self.add_item(leave_button)
-
-        info_button = discord.ui.Button(
-            label="Participants",
-            style=discord.ButtonStyle.primary,
-            custom_id=f"giveaway:info:{giveaway_id}",
-        )
-        info_button.callback = self.info_callback  # type: ignore[assignment]
-        self.add_item(info_button)
+        for label, style, action in self._BUTTONS:
+            button = discord.ui.Button(
+                label=label,
+                style=style,
+                custom_id=f"giveaway:{action}:{giveaway_id}",
+            )
+            button.callback = getattr(self, f"{action}_callback")  # type: ignore[assignment]
+            self.add_item(button)
 
     async def join_callback(self, interaction: discord.Interaction) -> None:
         """Handle a join button press by enlisting the interacting member."""
@@ -89,8 +106,6 @@ class GiveawayView(discord.ui.View):
         if not giveaway.participants:
             await interaction.response.send_message("No participants yet.", ephemeral=True)
             return
-        description = "\n".join(f"- <@{participant}>" for participant in giveaway.participants)
         await interaction.response.send_message(
-            f"Participants for **{giveaway.title}** (`{giveaway.id}`):\n{description}",
-            ephemeral=True,
+            **participant_roster(giveaway), ephemeral=True
         )